@@ -0,0 +1,473 @@
+"""
+Bitboard primitives and rollout kernels for Connect Four
+
+The position is two 49-bit integers (one per player) in the standard
+7-bits-per-column layout: bit ``7*col + row`` holds the cell in ``col``
+at ``row`` (row 0 is the bottom); the seventh bit of each column is a
+sentinel that keeps shifted win checks from wrapping between columns.
+The playout kernels run under numba when it is installed and fall back
+to pure Python otherwise.
+"""
+
+import random
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python fallbacks are used
+    np = None
+
+try:
+    from numba import njit
+    _NUMBA = np is not None
+except ImportError:  # Numba is optional; fall back to a pure-Python rollout
+    _NUMBA = False
+
+
+# Sampling weights favouring the center column during biased playouts
+CENTER_WEIGHTS = (1, 2, 3, 4, 3, 2, 1)
+
+# Bit offset of the bottom cell of each column
+COLUMN_BASE = (0, 7, 14, 21, 28, 35, 42)
+
+# Shift distances for the four alignment directions: vertical,
+# horizontal, and the two diagonals
+WIN_SHIFTS = (1, 7, 6, 8)
+
+# Top playable cell (row 5) of every column; a clear bit here means the
+# column still has room
+TOP_MASK = sum(1 << (base + 5) for base in COLUMN_BASE)
+
+
+def _generate_win_masks() -> Tuple[int, ...]:
+    """Enumerate the 69 four-in-a-row line masks in the bitboard layout."""
+    masks = []
+    for col in range(7):
+        for row in range(6):
+            for dc, dr in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                if 0 <= col + 3 * dc < 7 and 0 <= row + 3 * dr < 6:
+                    mask = 0
+                    for i in range(4):
+                        mask |= 1 << (7 * (col + i * dc) + row + i * dr)
+                    masks.append(mask)
+    return tuple(masks)
+
+
+# All 69 winning lines. The shift-AND test stays the primary win check;
+# the masks identify *which* lines are involved, e.g. for threat counts.
+WIN_MASKS = _generate_win_masks()
+
+
+def bb_wins(bb: int) -> bool:
+    """Branchless four-in-a-row test on a single player's bitboard."""
+    for d in WIN_SHIFTS:
+        m = bb & (bb >> d)
+        if m & (m >> (d + d)):
+            return True
+    return False
+
+
+if _NUMBA:
+    @njit(cache=True)
+    def rollout(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Play uniformly random moves until the game ends.
+
+        Operates directly on the bitboards in nopython mode so the whole
+        playout runs as machine code. `heights` must be a scratch int64
+        array (it is consumed). Returns the terminal value from Yellow's
+        perspective: 1 for a Yellow win, -1 for a Red win, 0 for a draw.
+        """
+        legal = np.empty(7, np.int64)
+        while True:
+            n = 0
+            for col in range(7):
+                if heights[col] - 7 * col < 6:
+                    legal[n] = col
+                    n += 1
+            if n == 0:
+                return 0
+
+            col = legal[np.random.randint(0, n)]
+            bit = np.int64(1) << heights[col]
+            heights[col] += 1
+            if player_idx == 0:
+                bb0 |= bit
+                bb = bb0
+            else:
+                bb1 |= bit
+                bb = bb1
+
+            m = bb & (bb >> 1)
+            if m & (m >> 2):
+                break
+            m = bb & (bb >> 7)
+            if m & (m >> 14):
+                break
+            m = bb & (bb >> 6)
+            if m & (m >> 12):
+                break
+            m = bb & (bb >> 8)
+            if m & (m >> 16):
+                break
+
+            player_idx = 1 - player_idx
+
+        return 1 if player_idx == 1 else -1
+
+    _CENTER_WEIGHTS_ARR = np.array(CENTER_WEIGHTS, np.int64)
+
+    @njit(cache=True)
+    def rollout_center(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Center-weighted random playout (inverse-CDF over CENTER_WEIGHTS)."""
+        legal = np.empty(7, np.int64)
+        cum = np.empty(7, np.int64)
+        while True:
+            n = 0
+            total = 0
+            for col in range(7):
+                if heights[col] - 7 * col < 6:
+                    legal[n] = col
+                    total += _CENTER_WEIGHTS_ARR[col]
+                    cum[n] = total
+                    n += 1
+            if n == 0:
+                return 0
+
+            r = np.random.randint(0, total)
+            i = 0
+            while cum[i] <= r:
+                i += 1
+            col = legal[i]
+
+            bit = np.int64(1) << heights[col]
+            heights[col] += 1
+            if player_idx == 0:
+                bb0 |= bit
+                bb = bb0
+            else:
+                bb1 |= bit
+                bb = bb1
+
+            m = bb & (bb >> 1)
+            if m & (m >> 2):
+                break
+            m = bb & (bb >> 7)
+            if m & (m >> 14):
+                break
+            m = bb & (bb >> 6)
+            if m & (m >> 12):
+                break
+            m = bb & (bb >> 8)
+            if m & (m >> 16):
+                break
+
+            player_idx = 1 - player_idx
+
+        return 1 if player_idx == 1 else -1
+
+    @njit(cache=True)
+    def count_threes(bb: int) -> int:
+        """Count three-aligned groups on one player's bitboard."""
+        total = 0
+        for d in (1, 7, 6, 8):
+            m = bb & (bb >> d) & (bb >> (2 * d))
+            while m:
+                m &= m - 1
+                total += 1
+        return total
+
+    @njit(cache=True)
+    def rollout_cutoff(bb0: int, bb1: int, heights, player_idx: int,
+                       cutoff: int) -> int:
+        """Random playout truncated after `cutoff` plies.
+
+        Positions that are still live at the cutoff are scored by a
+        light heuristic — the sign of the difference in three-aligned
+        groups — discretized to {-1, 0, 1} from Yellow's perspective.
+        """
+        legal = np.empty(7, np.int64)
+        for _ in range(cutoff):
+            n = 0
+            for col in range(7):
+                if heights[col] - 7 * col < 6:
+                    legal[n] = col
+                    n += 1
+            if n == 0:
+                return 0
+
+            col = legal[np.random.randint(0, n)]
+            bit = np.int64(1) << heights[col]
+            heights[col] += 1
+            if player_idx == 0:
+                bb0 |= bit
+                bb = bb0
+            else:
+                bb1 |= bit
+                bb = bb1
+
+            m = bb & (bb >> 1)
+            if m & (m >> 2):
+                return 1 if player_idx == 1 else -1
+            m = bb & (bb >> 7)
+            if m & (m >> 14):
+                return 1 if player_idx == 1 else -1
+            m = bb & (bb >> 6)
+            if m & (m >> 12):
+                return 1 if player_idx == 1 else -1
+            m = bb & (bb >> 8)
+            if m & (m >> 16):
+                return 1 if player_idx == 1 else -1
+
+            player_idx = 1 - player_idx
+
+        diff = count_threes(bb1) - count_threes(bb0)
+        if diff > 0:
+            return 1
+        if diff < 0:
+            return -1
+        return 0
+
+    @njit(cache=True)
+    def rollout_decisive(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Uniform playout that never overlooks an immediate win.
+
+        Before sampling, every legal move is tested as a candidate
+        four-in-a-row for the mover; if one exists the game ends there.
+        Otherwise the move is uniform random — and needs no win check
+        afterwards, since no winning move existed.
+        """
+        legal = np.empty(7, np.int64)
+        while True:
+            n = 0
+            for col in range(7):
+                if heights[col] - 7 * col < 6:
+                    legal[n] = col
+                    n += 1
+            if n == 0:
+                return 0
+
+            mine = bb0 if player_idx == 0 else bb1
+            for i in range(n):
+                cand = mine | (np.int64(1) << heights[legal[i]])
+                m = cand & (cand >> 1)
+                if m & (m >> 2):
+                    return 1 if player_idx == 1 else -1
+                m = cand & (cand >> 7)
+                if m & (m >> 14):
+                    return 1 if player_idx == 1 else -1
+                m = cand & (cand >> 6)
+                if m & (m >> 12):
+                    return 1 if player_idx == 1 else -1
+                m = cand & (cand >> 8)
+                if m & (m >> 16):
+                    return 1 if player_idx == 1 else -1
+
+            col = legal[np.random.randint(0, n)]
+            bit = np.int64(1) << heights[col]
+            heights[col] += 1
+            if player_idx == 0:
+                bb0 |= bit
+            else:
+                bb1 |= bit
+
+            player_idx = 1 - player_idx
+
+    def copy_heights(heights) -> 'np.ndarray':
+        """Scratch heights array for a single `rollout` call."""
+        return np.array(heights, dtype=np.int64)
+else:
+    def rollout(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Pure-Python rollout used when Numba is unavailable."""
+        bb = [bb0, bb1]
+        while True:
+            legal = [col for col in range(7) if heights[col] - 7 * col < 6]
+            if not legal:
+                return 0
+
+            col = legal[random.randrange(len(legal))]
+            bb[player_idx] |= 1 << heights[col]
+            heights[col] += 1
+
+            w = bb[player_idx]
+            m = w & (w >> 1)
+            if m & (m >> 2):
+                break
+            m = w & (w >> 7)
+            if m & (m >> 14):
+                break
+            m = w & (w >> 6)
+            if m & (m >> 12):
+                break
+            m = w & (w >> 8)
+            if m & (m >> 16):
+                break
+
+            player_idx = 1 - player_idx
+
+        return 1 if player_idx == 1 else -1
+
+    def rollout_center(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Pure-Python center-weighted playout fallback."""
+        bb = [bb0, bb1]
+        while True:
+            legal = [col for col in range(7) if heights[col] - 7 * col < 6]
+            if not legal:
+                return 0
+
+            col = random.choices(
+                legal, weights=[CENTER_WEIGHTS[c] for c in legal])[0]
+            bb[player_idx] |= 1 << heights[col]
+            heights[col] += 1
+
+            w = bb[player_idx]
+            m = w & (w >> 1)
+            if m & (m >> 2):
+                break
+            m = w & (w >> 7)
+            if m & (m >> 14):
+                break
+            m = w & (w >> 6)
+            if m & (m >> 12):
+                break
+            m = w & (w >> 8)
+            if m & (m >> 16):
+                break
+
+            player_idx = 1 - player_idx
+
+        return 1 if player_idx == 1 else -1
+
+    def count_threes(bb: int) -> int:
+        """Count three-aligned groups on one player's bitboard."""
+        total = 0
+        for d in WIN_SHIFTS:
+            total += (bb & (bb >> d) & (bb >> (2 * d))).bit_count()
+        return total
+
+    def rollout_cutoff(bb0: int, bb1: int, heights, player_idx: int,
+                       cutoff: int) -> int:
+        """Pure-Python fallback for the truncated playout."""
+        bb = [bb0, bb1]
+        for _ in range(cutoff):
+            legal = [col for col in range(7) if heights[col] - 7 * col < 6]
+            if not legal:
+                return 0
+
+            col = legal[random.randrange(len(legal))]
+            bb[player_idx] |= 1 << heights[col]
+            heights[col] += 1
+
+            if bb_wins(bb[player_idx]):
+                return 1 if player_idx == 1 else -1
+
+            player_idx = 1 - player_idx
+
+        diff = count_threes(bb[1]) - count_threes(bb[0])
+        return (diff > 0) - (diff < 0)
+
+    def rollout_decisive(bb0: int, bb1: int, heights, player_idx: int) -> int:
+        """Pure-Python fallback for the decisive-move playout."""
+        bb = [bb0, bb1]
+        while True:
+            legal = [col for col in range(7) if heights[col] - 7 * col < 6]
+            if not legal:
+                return 0
+
+            mine = bb[player_idx]
+            for col in legal:
+                if bb_wins(mine | (1 << heights[col])):
+                    return 1 if player_idx == 1 else -1
+
+            col = legal[random.randrange(len(legal))]
+            bb[player_idx] |= 1 << heights[col]
+            heights[col] += 1
+
+            player_idx = 1 - player_idx
+
+    def copy_heights(heights) -> List[int]:
+        """Scratch heights list for a single `rollout` call."""
+        return heights[:]
+
+
+if np is not None:
+    def batch_rollout(bb0: int, bb1: int, heights, player_idx: int,
+                      batch: int) -> int:
+        """Run `batch` independent random playouts from one position.
+
+        All playouts advance in lockstep as NumPy array operations, so
+        the Python overhead per step is amortized across the batch.
+        Returns the summed terminal values from Yellow's perspective.
+        """
+        bbs = [np.full(batch, bb0, np.int64), np.full(batch, bb1, np.int64)]
+        hts = np.tile(np.asarray(heights, np.int64), (batch, 1))
+        values = np.zeros(batch, np.int64)
+        active = np.ones(batch, bool)
+        rows = np.arange(batch)
+        col_base = np.arange(7, dtype=np.int64) * 7
+
+        while True:
+            legal = (hts - col_base) < 6
+            n_legal = legal.sum(axis=1)
+            active &= n_legal > 0  # exhausted boards are draws (value 0)
+            if not active.any():
+                break
+
+            # Pick the k-th legal column per board, k uniform in [0, n_legal)
+            k = (np.random.random(batch) * n_legal).astype(np.int64)
+            col = (legal.cumsum(axis=1) > k[:, None]).argmax(axis=1)
+
+            bit = np.int64(1) << hts[rows, col]
+            bbs[player_idx][active] |= bit[active]
+            hts[rows, col] += active
+
+            w = bbs[player_idx]
+            won = np.zeros(batch, bool)
+            for d in WIN_SHIFTS:
+                m = w & (w >> d)
+                won |= (m & (m >> (d + d))) != 0
+
+            values[active & won] = 1 if player_idx == 1 else -1
+            active &= ~won
+            player_idx ^= 1
+
+        return int(values.sum())
+else:
+    def batch_rollout(bb0: int, bb1: int, heights, player_idx: int,
+                      batch: int) -> int:
+        """Sequential fallback when NumPy is unavailable."""
+        return sum(rollout(bb0, bb1, copy_heights(heights), player_idx)
+                   for _ in range(batch))
+
+
+if _NUMBA:
+    @njit(cache=True)
+    def _seed_numba(seed: int) -> None:
+        np.random.seed(seed)
+
+
+def seed_rollouts(seed: int) -> None:
+    """Seed the RNG streams the playout kernels draw from.
+
+    The njit kernels use numba's per-process np.random state and
+    batch_rollout uses NumPy's; neither is touched by random.seed, so
+    callers that need reproducible playouts (e.g. seeded tournament
+    workers) must call this alongside it. The pure-Python fallbacks
+    draw from the stdlib random module, which callers seed directly.
+    """
+    if np is not None:
+        np.random.seed(seed & 0xFFFFFFFF)
+    if _NUMBA:
+        _seed_numba(seed & 0xFFFFFFFF)
+
+
+if _NUMBA:
+    # Materialize the compiled kernels at import time (on a full board,
+    # so each call returns immediately) instead of paying the JIT stall
+    # on the first select_move. With cache=True the machine code also
+    # persists on disk, and forked workers inherit the warm state.
+    _FULL_HEIGHTS = np.array([base + 6 for base in COLUMN_BASE], np.int64)
+    rollout(0, 0, _FULL_HEIGHTS.copy(), 0)
+    rollout_center(0, 0, _FULL_HEIGHTS.copy(), 0)
+    rollout_cutoff(0, 0, _FULL_HEIGHTS.copy(), 0, 0)
+    rollout_decisive(0, 0, _FULL_HEIGHTS.copy(), 0)
+    del _FULL_HEIGHTS
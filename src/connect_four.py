@@ -8,146 +8,225 @@ Team: [Student A, Student B]
 import sys
 import random
 import math
+import multiprocessing
 import time
+from array import array
 from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
+from bitboard import (COLUMN_BASE, TOP_MASK, WIN_MASKS, batch_rollout,
+                      bb_wins, copy_heights, rollout, rollout_center,
+                      rollout_cutoff as _rollout_cutoff_kernel,
+                      rollout_decisive, seed_rollouts)
 
-def _opponent(player: str) -> str:
-    """Return the opposing player's token."""
-    return 'Y' if player == 'R' else 'R'
+
+# Player tokens double as bitboard indices in Board.bb; EMPTY only
+# appears at the file/CLI boundary.
+R, Y, EMPTY = 0, 1, 2
+
+
+def _opponent(player: int) -> int:
+    """Return the opposing player."""
+    return player ^ 1
+
+
+def _make_executor(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """Process pool on the fork context where the platform offers it.
+
+    Forked workers inherit the parent's imported modules (and any
+    compiled numba kernels) instead of re-importing everything per
+    process, which matters when tasks are short.
+    """
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:  # e.g. Windows: fall back to the default context
+        ctx = None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+
+# Translation between the file/CLI character tokens and the players
+_TOKEN_TO_PLAYER = {'R': R, 'Y': Y}
 
 
 class Board:
-    """Represents a Connect Four game board (7 columns x 6 rows)"""
+    """Represents a Connect Four game board (7 columns x 6 rows).
+
+    The position is stored as two bitboards (one per player) using the
+    standard 7-bits-per-column layout: bit ``7*col + row`` holds the cell
+    in ``col`` at ``row`` (row 0 is the bottom). Move generation, win
+    detection, and copying are all a handful of integer operations.
+    """
+
+    __slots__ = ('bb', 'heights')
 
     ROWS = 6
     COLS = 7
 
     def __init__(self):
         """Initialize empty board"""
-        self.grid = [['O' for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        self.heights = [0] * self.COLS  # Track how many pieces in each column
+        self.bb = [0, 0]  # Bitboards indexed by player (R=0, Y=1)
+        # Next free bit per column, kept in a compact signed-byte array
+        # rather than a list of boxed ints
+        self.heights = array('b', COLUMN_BASE)
 
     def copy(self) -> 'Board':
         """Create a copy of the board"""
         new_board = Board()
-        new_board.grid = [row[:] for row in self.grid]
-        new_board.heights = self.heights[:]
+        new_board.bb = self.bb[:]
+        new_board.heights = array('b', self.heights)
         return new_board
 
     def is_valid_move(self, col: int) -> bool:
         """Check if a move is valid (column not full)"""
-        return 0 <= col < self.COLS and self.heights[col] < self.ROWS
+        return 0 <= col < self.COLS and self.heights[col] - COLUMN_BASE[col] < self.ROWS
 
-    def make_move(self, col: int, player: str) -> bool:
+    def make_move(self, col: int, player: int) -> bool:
         """Make a move in the specified column for the given player"""
         if not self.is_valid_move(col):
             return False
 
-        row = self.ROWS - 1 - self.heights[col]
-        self.grid[row][col] = player
+        self.bb[player] ^= 1 << self.heights[col]
         self.heights[col] += 1
         return True
 
     def undo_move(self, col: int) -> bool:
         """Undo the last move in the specified column"""
-        if self.heights[col] == 0:
+        if self.heights[col] == COLUMN_BASE[col]:
             return False
 
         self.heights[col] -= 1
-        row = self.ROWS - 1 - self.heights[col]
-        self.grid[row][col] = 'O'
+        mask = 1 << self.heights[col]
+        if self.bb[0] & mask:
+            self.bb[0] ^= mask
+        else:
+            self.bb[1] ^= mask
         return True
 
     def get_legal_moves(self) -> List[int]:
         """Get list of legal moves (columns that aren't full)"""
-        return [col for col in range(self.COLS) if self.is_valid_move(col)]
+        free_top = ~(self.bb[0] | self.bb[1]) & TOP_MASK
+        moves = []
+        while free_top:
+            lsb = free_top & -free_top
+            moves.append((lsb.bit_length() - 1) // 7)
+            free_top ^= lsb
+        return moves
 
     def is_full(self) -> bool:
         """Check if board is completely full (draw)"""
-        return all(height == self.ROWS for height in self.heights)
+        return not (~(self.bb[0] | self.bb[1]) & TOP_MASK)
 
-    def check_win(self, player: str) -> bool:
+    def check_win(self, player: int) -> bool:
         """Check if the specified player has won"""
-        # Check horizontal
-        for row in range(self.ROWS):
-            for col in range(self.COLS - 3):
-                if all(self.grid[row][col+i] == player for i in range(4)):
-                    return True
-
-        # Check vertical
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS):
-                if all(self.grid[row+i][col] == player for i in range(4)):
-                    return True
-
-        # Check diagonal (down-right)
-        for row in range(self.ROWS - 3):
-            for col in range(self.COLS - 3):
-                if all(self.grid[row+i][col+i] == player for i in range(4)):
-                    return True
-
-        # Check diagonal (down-left)
-        for row in range(self.ROWS - 3):
-            for col in range(3, self.COLS):
-                if all(self.grid[row+i][col-i] == player for i in range(4)):
-                    return True
-
-        return False
-
-    def is_terminal(self) -> Tuple[bool, int]:
+        return bb_wins(self.bb[player])
+
+    def count_threats(self, player: int) -> int:
+        """Count lines with three of the player's pieces and one empty cell"""
+        own = self.bb[player]
+        occupied = self.bb[0] | self.bb[1]
+        count = 0
+        for mask in WIN_MASKS:
+            line_own = own & mask
+            if (occupied & mask) == line_own and line_own.bit_count() == 3:
+                count += 1
+        return count
+
+    def is_terminal(self, last_player: Optional[int] = None) -> Tuple[bool, int]:
         """
         Check if game is terminal
         Returns: (is_terminal, value)
         Value: 1 for Yellow win, -1 for Red win, 0 for draw
+
+        Only the player who just moved can have completed a line, so
+        callers that know the last mover pass it to halve the win test.
         """
-        if self.check_win('Y'):
-            return True, 1
-        if self.check_win('R'):
-            return True, -1
+        if last_player is None:
+            if bb_wins(self.bb[Y]):
+                return True, 1
+            if bb_wins(self.bb[R]):
+                return True, -1
+        elif bb_wins(self.bb[last_player]):
+            return True, 1 if last_player == Y else -1
         if self.is_full():
             return True, 0
         return False, 0
 
-    def load_from_file(self, filename: str) -> Tuple[str, str]:
+    def terminal_state(self, last_player: Optional[int] = None) -> int:
+        """Tuple-free variant of `is_terminal` for per-move game loops.
+
+        Returns 0 while the game is live, 1 for a Yellow win, -1 for a
+        Red win, and 2 for a draw, so callers can test truthiness
+        without unpacking a fresh tuple every move.
+        """
+        if last_player is None:
+            if bb_wins(self.bb[Y]):
+                return 1
+            if bb_wins(self.bb[R]):
+                return -1
+        elif bb_wins(self.bb[last_player]):
+            return 1 if last_player == Y else -1
+        return 2 if self.is_full() else 0
+
+    def load_from_file(self, filename: str) -> Tuple[str, int]:
         """Load board state from file, return (algorithm, player_to_move)"""
         with open(filename, 'r') as f:
             lines = f.readlines()
 
         algorithm = lines[0].strip()
-        player = lines[1].strip()
+        player = _TOKEN_TO_PLAYER[lines[1].strip()]
 
-        # Load board state (lines 2-7)
-        for row in range(self.ROWS):
-            line = lines[2 + row].strip()
+        # Load board state (lines 2-7, top row first)
+        for file_row in range(self.ROWS):
+            line = lines[2 + file_row].strip()
+            row = self.ROWS - 1 - file_row
             for col in range(self.COLS):
-                if col < len(line):
-                    self.grid[row][col] = line[col]
-                    if line[col] != 'O':
-                        self.heights[col] += 1
+                if col < len(line) and line[col] != 'O':
+                    self.bb[_TOKEN_TO_PLAYER[line[col]]] |= 1 << (COLUMN_BASE[col] + row)
+                    self.heights[col] += 1
 
         return algorithm, player
 
     def __str__(self) -> str:
         """String representation of the board"""
-        return '\n'.join(''.join(row) for row in self.grid)
+        rows = []
+        for row in range(self.ROWS - 1, -1, -1):
+            cells = []
+            for col in range(self.COLS):
+                mask = 1 << (COLUMN_BASE[col] + row)
+                if self.bb[R] & mask:
+                    cells.append('R')
+                elif self.bb[Y] & mask:
+                    cells.append('Y')
+                else:
+                    cells.append('O')
+            rows.append(''.join(cells))
+        return '\n'.join(rows)
 
 
 class MCTSNode:
     """Node in the MCTS tree"""
 
+    __slots__ = ('parent', 'move', 'children', '_expanded_cols', 'wi', 'ni',
+                 '_mean', '_inv_sqrt_ni', 'untried_moves', 'player_to_move')
+
     def __init__(
         self,
         parent: Optional['MCTSNode'] = None,
         move: Optional[int] = None,
-        player_to_move: str = 'Y',
+        player_to_move: int = Y,
     ):
         self.parent = parent
         self.move = move  # Move that led to this node (0-indexed col)
-        self.children: Dict[int, 'MCTSNode'] = {}
+        # One slot per column; unexpanded moves stay None. A plain list
+        # keeps the at-most-7 children contiguous and avoids dict hashing
+        # in the selection loop.
+        self.children: List[Optional['MCTSNode']] = [None] * Board.COLS
+        self._expanded_cols: List[int] = []  # Columns with a child, in expansion order
         self.wi = 0.0  # Total accumulated value from Yellow's perspective
         self.ni = 0  # Visit count
+        self._mean = 0.0  # wi/ni, refreshed during backpropagation
+        self._inv_sqrt_ni = 0.0  # 1/sqrt(ni), refreshed during backpropagation
         self.untried_moves: List[int] = []
         self.player_to_move = player_to_move
 
@@ -155,54 +234,60 @@ class MCTSNode:
         """Check if all possible moves have been tried"""
         return len(self.untried_moves) == 0
 
-    def best_child(self, c_param: float = 1.4) -> Optional['MCTSNode']:
-        """Select best child using the UCB rule with min/max behaviour."""
-        if not self.children:
-            return None
+    def best_child(self, c_param: float = 1.4,
+                   rng: random.Random = random) -> Tuple[int, Optional['MCTSNode']]:
+        """Select best child using the UCB rule with min/max behaviour.
 
-        unexplored = [child for child in self.children.values() if child.ni == 0]
+        Returns (column, child); the column comes from the child's slot
+        index so nodes shared through the transposition table are safe.
+        """
+        if not self._expanded_cols:
+            return -1, None
+
+        unexplored = [col for col in self._expanded_cols
+                      if self.children[col].ni == 0]
         if unexplored:
-            return random.choice(unexplored)
+            col = rng.choice(unexplored)
+            return col, self.children[col]
 
-        if self.player_to_move == 'Y':
-            best_value = -float('inf')
-            comparator = lambda current, best: current > best
-        else:
-            best_value = float('inf')
-            comparator = lambda current, best: current < best
+        # Negating the mean for Red turns the min/max split into a single
+        # argmax, and log(ni) only depends on the parent so it is hoisted
+        # out of the per-child loop.
+        sign = 1.0 if self.player_to_move == Y else -1.0
+        sqrt_log_n = math.sqrt(math.log(self.ni))
 
+        best_value = -float('inf')
+        best_move = -1
         best_child = None
 
-        for child in self.children.values():
-            exploitation = child.wi / child.ni
-            exploration = c_param * math.sqrt(math.log(self.ni) / child.ni)
-            ucb_value = exploitation + exploration
+        for col in self._expanded_cols:
+            child = self.children[col]
+            ucb_value = (sign * child._mean
+                         + c_param * sqrt_log_n * child._inv_sqrt_ni)
 
-            if comparator(ucb_value, best_value):
+            if ucb_value > best_value:
                 best_value = ucb_value
+                best_move = col
                 best_child = child
 
-        return best_child
+        return best_move, best_child
 
     def best_child_final(self) -> Tuple[int, Optional['MCTSNode']]:
         """Select best child for final move (no exploration)"""
-        if not self.children:
+        if not self._expanded_cols:
             return -1, None
 
-        if self.player_to_move == 'Y':
-            best_value = -float('inf')
-            comparator = lambda current, best: current > best
-        else:
-            best_value = float('inf')
-            comparator = lambda current, best: current < best
+        sign = 1.0 if self.player_to_move == Y else -1.0
 
+        best_value = -float('inf')
         best_move = -1
         best_child = None
 
-        for move, child in self.children.items():
-            if child.ni > 0:
-                value = child.wi / child.ni
-                if comparator(value, best_value):
+        for move in range(Board.COLS):
+            child = self.children[move]
+            if child is not None and child.ni > 0:
+                value = sign * child._mean
+                if value > best_value:
                     best_value = value
                     best_move = move
                     best_child = child
@@ -216,7 +301,7 @@ class URAlgorithm:
     def __init__(self, board: Board):
         self.board = board
 
-    def select_move(self, player: str, verbosity: str = "None", param: int = 0) -> int:
+    def select_move(self, player: int, verbosity: str = "None", param: int = 0) -> int:
         """Select a random legal move"""
         legal_moves = self.board.get_legal_moves()
         if not legal_moves:
@@ -230,199 +315,274 @@ class URAlgorithm:
         return move
 
 
-class PMCGSAlgorithm:
-    """Pure Monte Carlo Game Search algorithm"""
+class MCTSBase:
+    """Shared engine for the Monte Carlo tree-search algorithms.
 
-    def __init__(self, board: Board):
-        self.board = board
+    Subclasses supply the tree policy via `_select_child` (plus the
+    verbose trace hook) and a `kind` tag for the worker dispatch
+    tables; selection scaffolding, expansion, rollouts,
+    backpropagation, tree reuse, and the transposition table live here
+    once so every speedup applies to both algorithms.
+    """
 
-    def select_move(self, player: str, verbosity: str, num_simulations: int) -> int:
-        """Run PMCGS and select best move"""
-        root = MCTSNode(player_to_move=player)
-        root.untried_moves = self.board.get_legal_moves().copy()
+    kind = ""
 
+    def __init__(self, board: Board, rollout_batch: int = 1,
+                 playout_policy: str = 'uniform',
+                 rollout_cutoff: Optional[int] = None):
+        self.board = board
+        # Rollouts per expanded leaf; values > 1 run the playouts as one
+        # vectorized batch and credit every node on the path with the
+        # whole batch.
+        self.rollout_batch = rollout_batch
+        # 'uniform' keeps the reference playout semantics;
+        # 'center_biased' samples rollout moves by CENTER_WEIGHTS;
+        # 'decisive' plays an immediate win whenever one exists.
+        self.playout_policy = playout_policy
+        # Truncate playouts after this many plies and score the live
+        # position with a three-in-a-row heuristic instead of playing
+        # to the end. Applies to the scalar uniform playout path only;
+        # batched and center-biased playouts always run to terminal.
+        self.rollout_cutoff = rollout_cutoff
+        if playout_policy == 'center_biased':
+            self._rollout_fn = rollout_center
+        elif playout_policy == 'decisive':
+            self._rollout_fn = rollout_decisive
+        elif rollout_cutoff is not None:
+            # The kernel is imported under an alias: inside this scope
+            # the bare name `rollout_cutoff` is the int parameter.
+            self._rollout_fn = (lambda b0, b1, h, p, _c=rollout_cutoff:
+                                _rollout_cutoff_kernel(b0, b1, h, p, _c))
+        else:
+            self._rollout_fn = rollout
+        # Transposition table keyed on the packed position: the two
+        # 49-bit bitboards concatenated into one int. The key is exact,
+        # so unlike a Zobrist hash there are no collisions to handle.
+        self._tt: Dict[int, MCTSNode] = {}
+        # Subtree kept warm from our previous turn (tree reuse)
+        self._last_root: Optional[MCTSNode] = None
+        self._expected_bb: Optional[Tuple[int, int]] = None
+
+    def _select_child(self, node: MCTSNode,
+                      rng: random.Random) -> Tuple[int, Optional[MCTSNode]]:
+        """Tree policy: pick the child to descend into."""
+        raise NotImplementedError
+
+    def _trace_selection(self, node: MCTSNode) -> None:
+        """Verbose-mode trace printed before each selection step."""
+        print(f"wi: {node.wi}")
+        print(f"ni: {node.ni}")
+
+    def _search(self, player: int, verbosity: str, num_simulations: int) -> MCTSNode:
+        """Build the search tree and return its root."""
+        root = self._advance_root(player)
+        if root is None:
+            root = MCTSNode(player_to_move=player)
+            root.untried_moves = self.board.get_legal_moves()
+            # Fresh transposition table on a cold start; a resumed tree
+            # keeps its table so transpositions stay shared.
+            self._tt = {}
+
+        # One RNG for the whole decision, derived from the global
+        # stream. Note random.seed() only controls selection and
+        # expansion: the njit playout kernels draw from the NumPy/numba
+        # streams, which bitboard.seed_rollouts seeds separately.
+        rng = random.Random(random.getrandbits(64))
+
+        # Pick the simulation routine once; the quiet variant carries no
+        # verbosity checks at all, so the hot loop stays branch-free.
+        sim = (self._run_simulation_verbose if verbosity == "Verbose"
+               else self._run_simulation_quiet)
         for _ in range(num_simulations):
-            self._run_simulation(root, player, verbosity)
+            sim(root, player, rng)
+
+        return root
+
+    def _advance_root(self, player: int) -> Optional[MCTSNode]:
+        """Resume the subtree kept from our previous turn, if possible.
+
+        Valid only when the board has advanced from our last move by
+        exactly one opponent piece and that reply was already expanded;
+        otherwise the caller starts a cold tree.
+        """
+        last, self._last_root = self._last_root, None
+        expected, self._expected_bb = self._expected_bb, None
+        if last is None or expected is None:
+            return None
+
+        diff = ((self.board.bb[0] ^ expected[0])
+                | (self.board.bb[1] ^ expected[1]))
+        if diff == 0 or diff & (diff - 1):
+            return None  # not exactly one new piece
+        if self.board.bb[player] != expected[player]:
+            return None  # the new piece is not the opponent's
+
+        node = last.children[(diff.bit_length() - 1) // 7]
+        if node is None or node.player_to_move != player:
+            return None
+        node.parent = None
+        return node
+
+    def select_move(self, player: int, verbosity: str, num_simulations: int) -> int:
+        """Run the tree search and select the best move"""
+        root = self._search(player, verbosity, num_simulations)
 
         # Print column values
         if verbosity in ("Verbose", "Brief"):
             self._print_column_values(root)
 
         # Select final move
-        final_move, _ = root.best_child_final()
+        final_move, final_child = root.best_child_final()
+
+        # Keep the chosen subtree warm for our next turn in this game
+        self._last_root = final_child
+        if final_child is not None:
+            expected = self.board.bb[:]
+            expected[player] |= 1 << self.board.heights[final_move]
+            self._expected_bb = (expected[0], expected[1])
 
         if verbosity in ("Verbose", "Brief"):
             print(f"FINAL Move selected: {final_move + 1}")  # 1-indexed
 
         return final_move
 
-    def _run_simulation(self, root: MCTSNode, player: str, verbosity: str) -> None:
-        """Run a single simulation"""
-        current_board = self.board.copy()
+    def select_move_parallel(self, player: int, num_simulations: int,
+                             workers: int) -> int:
+        """Root-parallel search: split the budget across worker processes."""
+        return _select_move_root_parallel(self.board, self.kind, player,
+                                          num_simulations, workers)
+
+    def _run_simulation_quiet(self, root: MCTSNode, player: int,
+                              rng: random.Random) -> None:
+        """Run a single simulation (no trace output)"""
+        current_board = self.board
+        moves_played: List[int] = []
         path = [root]
 
-        # Selection phase (random choice among expanded children)
-        while path[-1].is_fully_expanded() and path[-1].children:
-            node = path[-1]
-            move = random.choice(list(node.children.keys()))
-            child = node.children[move]
+        # Hoist per-step attribute lookups out of the descent loop
+        select_child = self._select_child
+        make_move = current_board.make_move
 
-            if verbosity == "Verbose":
-                print(f"wi: {node.wi}")
-                print(f"ni: {node.ni}")
-                print(f"Move selected: {move + 1}")
+        # Selection phase (tree policy supplied by the subclass)
+        node = root
+        while node.is_fully_expanded() and node._expanded_cols:
+            move, child = select_child(node, rng)
+            if child is None:
+                break
 
-            current_board.make_move(move, node.player_to_move)
+            make_move(move, node.player_to_move)
+            moves_played.append(move)
             path.append(child)
+            node = child
 
-        node = path[-1]
-        is_terminal, value = current_board.is_terminal()
+        is_terminal, value = current_board.is_terminal(
+            _opponent(node.player_to_move) if moves_played else None)
 
         # Expansion
         if not is_terminal and not node.is_fully_expanded():
-            move = random.choice(node.untried_moves)
-            node.untried_moves.remove(move)
+            untried = node.untried_moves
+            idx = rng.randrange(len(untried))
+            move = untried[idx]
+            untried[idx] = untried[-1]
+            untried.pop()
             current_board.make_move(move, node.player_to_move)
+            moves_played.append(move)
 
             next_player = _opponent(node.player_to_move)
-            new_node = MCTSNode(node, move, next_player)
-            new_node.untried_moves = current_board.get_legal_moves().copy()
+            key = current_board.bb[0] | (current_board.bb[1] << 49)
+            new_node = self._tt.get(key)
+            if new_node is None:
+                new_node = MCTSNode(node, move, next_player)
+                new_node.untried_moves = current_board.get_legal_moves()
+                self._tt[key] = new_node
             node.children[move] = new_node
+            node._expanded_cols.append(move)
             path.append(new_node)
 
-            if verbosity == "Verbose":
-                print("NODE ADDED")
-
-            is_terminal, value = current_board.is_terminal()
+            is_terminal, value = current_board.is_terminal(node.player_to_move)
             node = new_node
 
         # Rollout (random moves until terminal)
-        current_player = path[-1].player_to_move
-        if is_terminal and verbosity == "Verbose":
-            print(f"TERMINAL NODE VALUE: {value}")
-
-        while not is_terminal:
-            legal_moves = current_board.get_legal_moves()
-            if not legal_moves:
-                value = 0
-                break
-
-            move = random.choice(legal_moves)
-            if verbosity == "Verbose":
-                print(f"Move selected: {move + 1}")
-
-            current_board.make_move(move, current_player)
-            current_player = _opponent(current_player)
-            is_terminal, value = current_board.is_terminal()
-
-            if is_terminal and verbosity == "Verbose":
-                print(f"TERMINAL NODE VALUE: {value}")
+        n_rollouts = 1
+        if not is_terminal:
+            current_player = path[-1].player_to_move
+            if self.rollout_batch > 1:
+                value = batch_rollout(current_board.bb[0], current_board.bb[1],
+                                       current_board.heights,
+                                       current_player,
+                                       self.rollout_batch)
+                n_rollouts = self.rollout_batch
+            else:
+                value = self._rollout_fn(current_board.bb[0],
+                                         current_board.bb[1],
+                                         copy_heights(current_board.heights),
+                                         current_player)
 
         # Backpropagation (values already from Yellow perspective)
         for node in reversed(path):
-            node.ni += 1
+            node.ni += n_rollouts
             node.wi += value
-
-            if verbosity == "Verbose":
-                print("Updated values:")
-                print(f"wi: {node.wi}")
-                print(f"ni: {node.ni}")
-
-    def _print_column_values(self, root: MCTSNode) -> None:
-        """Print the estimated values for each column"""
-        for col in range(Board.COLS):
-            if not self.board.is_valid_move(col):
-                print(f"Column {col + 1}: Null")
-                continue
-
-            if col in root.children and root.children[col].ni > 0:
-                value = root.children[col].wi / root.children[col].ni
-                print(f"Column {col + 1}: {value:.3f}")
-            else:
-                print(f"Column {col + 1}: 0.000")
-
-
-class UCTAlgorithm:
-    """Upper Confidence Bound for Trees algorithm"""
-
-    def __init__(self, board: Board):
-        self.board = board
-
-    def select_move(self, player: str, verbosity: str, num_simulations: int) -> int:
-        """Run UCT and select best move"""
-        root = MCTSNode(player_to_move=player)
-        root.untried_moves = self.board.get_legal_moves().copy()
-
-        for _ in range(num_simulations):
-            self._run_simulation(root, player, verbosity)
-
-        # Print column values
-        if verbosity in ("Verbose", "Brief"):
-            self._print_column_values(root)
-
-        # Select final move
-        final_move, _ = root.best_child_final()
-
-        if verbosity in ("Verbose", "Brief"):
-            print(f"FINAL Move selected: {final_move + 1}")  # 1-indexed
-
-        return final_move
-
-    def _run_simulation(self, root: MCTSNode, player: str, verbosity: str) -> None:
-        """Run a single simulation with UCT selection"""
-        current_board = self.board.copy()
+            node._mean = node.wi / node.ni
+            node._inv_sqrt_ni = 1.0 / math.sqrt(node.ni)
+
+        # Unwind the shared board so the next simulation starts fresh
+        for col in reversed(moves_played):
+            current_board.undo_move(col)
+
+    def _run_simulation_verbose(self, root: MCTSNode, player: int,
+                                rng: random.Random) -> None:
+        """Run a single simulation, printing the assignment trace"""
+        current_board = self.board
+        moves_played: List[int] = []
         path = [root]
 
-        # Selection phase (UCT)
-        while path[-1].is_fully_expanded() and path[-1].children:
+        # Selection phase (tree policy supplied by the subclass)
+        while path[-1].is_fully_expanded() and path[-1]._expanded_cols:
             node = path[-1]
-            if verbosity == "Verbose":
-                print(f"wi: {node.wi}")
-                print(f"ni: {node.ni}")
-                for i, (move, child) in enumerate(sorted(node.children.items()), 1):
-                    if child.ni > 0 and node.ni > 0:
-                        exploitation = child.wi / child.ni
-                        exploration = 1.4 * math.sqrt(math.log(node.ni) / child.ni)
-                        ucb_value = exploitation + exploration
-                        print(f"V{i}: {ucb_value:.3f}")
-                    else:
-                        print(f"V{i}: INF")
-
-            best_child = path[-1].best_child()
-            if best_child is None or best_child.move is None:
+            self._trace_selection(node)
+            move, child = self._select_child(node, rng)
+            if child is None:
                 break
 
-            move = best_child.move
-            if verbosity == "Verbose":
-                print(f"Move selected: {move + 1}")
+            print(f"Move selected: {move + 1}")
 
             current_board.make_move(move, node.player_to_move)
-            path.append(best_child)
+            moves_played.append(move)
+            path.append(child)
 
         node = path[-1]
-        is_terminal, value = current_board.is_terminal()
+        is_terminal, value = current_board.is_terminal(
+            _opponent(node.player_to_move) if moves_played else None)
 
         # Expansion
         if not is_terminal and not node.is_fully_expanded():
-            move = random.choice(node.untried_moves)
-            node.untried_moves.remove(move)
+            untried = node.untried_moves
+            idx = rng.randrange(len(untried))
+            move = untried[idx]
+            untried[idx] = untried[-1]
+            untried.pop()
             current_board.make_move(move, node.player_to_move)
+            moves_played.append(move)
 
             next_player = _opponent(node.player_to_move)
-            new_node = MCTSNode(node, move, next_player)
-            new_node.untried_moves = current_board.get_legal_moves().copy()
+            key = current_board.bb[0] | (current_board.bb[1] << 49)
+            new_node = self._tt.get(key)
+            if new_node is None:
+                new_node = MCTSNode(node, move, next_player)
+                new_node.untried_moves = current_board.get_legal_moves()
+                self._tt[key] = new_node
             node.children[move] = new_node
+            node._expanded_cols.append(move)
             path.append(new_node)
 
-            if verbosity == "Verbose":
-                print("NODE ADDED")
+            print("NODE ADDED")
 
-            is_terminal, value = current_board.is_terminal()
+            is_terminal, value = current_board.is_terminal(node.player_to_move)
             node = new_node
 
-        # Rollout (random moves until terminal)
+        # Rollout (random moves until terminal, printed step by step)
         current_player = path[-1].player_to_move
-        if is_terminal and verbosity == "Verbose":
+        if is_terminal:
             print(f"TERMINAL NODE VALUE: {value}")
 
         while not is_terminal:
@@ -431,26 +591,31 @@ class UCTAlgorithm:
                 value = 0
                 break
 
-            move = random.choice(legal_moves)
-            if verbosity == "Verbose":
-                print(f"Move selected: {move + 1}")
+            move = legal_moves[rng.randrange(len(legal_moves))]
+            print(f"Move selected: {move + 1}")
 
             current_board.make_move(move, current_player)
+            moves_played.append(move)
+            is_terminal, value = current_board.is_terminal(current_player)
             current_player = _opponent(current_player)
-            is_terminal, value = current_board.is_terminal()
 
-            if is_terminal and verbosity == "Verbose":
+            if is_terminal:
                 print(f"TERMINAL NODE VALUE: {value}")
 
-        # Backpropagation
+        # Backpropagation (values already from Yellow perspective)
         for node in reversed(path):
             node.ni += 1
             node.wi += value
+            node._mean = node.wi / node.ni
+            node._inv_sqrt_ni = 1.0 / math.sqrt(node.ni)
+
+            print("Updated values:")
+            print(f"wi: {node.wi}")
+            print(f"ni: {node.ni}")
 
-            if verbosity == "Verbose":
-                print("Updated values:")
-                print(f"wi: {node.wi}")
-                print(f"ni: {node.ni}")
+        # Unwind the shared board so the next simulation starts fresh
+        for col in reversed(moves_played):
+            current_board.undo_move(col)
 
     def _print_column_values(self, root: MCTSNode) -> None:
         """Print the estimated values for each column"""
@@ -459,17 +624,74 @@ class UCTAlgorithm:
                 print(f"Column {col + 1}: Null")
                 continue
 
-            if col in root.children and root.children[col].ni > 0:
-                value = root.children[col].wi / root.children[col].ni
+            child = root.children[col]
+            if child is not None and child.ni > 0:
+                value = child.wi / child.ni
                 print(f"Column {col + 1}: {value:.3f}")
             else:
                 print(f"Column {col + 1}: 0.000")
 
 
+class PMCGSAlgorithm(MCTSBase):
+    """Pure Monte Carlo Game Search algorithm"""
+
+    kind = "PMCGS"
+
+    def _select_child(self, node: MCTSNode,
+                      rng: random.Random) -> Tuple[int, Optional[MCTSNode]]:
+        """Descend uniformly at random among expanded children."""
+        cols = node._expanded_cols
+        move = cols[rng.randrange(len(cols))]
+        return move, node.children[move]
+
+
+class UCTAlgorithm(MCTSBase):
+    """Upper Confidence Bound for Trees algorithm"""
+
+    kind = "UCT"
+
+    def _select_child(self, node: MCTSNode,
+                      rng: random.Random) -> Tuple[int, Optional[MCTSNode]]:
+        """Descend by UCB1 (sign-flipped for the minimizing player)."""
+        return node.best_child(rng=rng)
+
+    def _trace_selection(self, node: MCTSNode) -> None:
+        """UCT trace additionally prints each child's UCB value."""
+        super()._trace_selection(node)
+        expanded = [(col, node.children[col])
+                    for col in sorted(node._expanded_cols)]
+        sign = 1.0 if node.player_to_move == Y else -1.0
+        sqrt_log_n = math.sqrt(math.log(node.ni)) if node.ni > 0 else 0.0
+        for i, (move, child) in enumerate(expanded, 1):
+            if child.ni > 0 and node.ni > 0:
+                ucb_value = (sign * (child.wi / child.ni)
+                             + 1.4 * sqrt_log_n / math.sqrt(child.ni))
+                print(f"V{i}: {ucb_value:.3f}")
+            else:
+                print(f"V{i}: INF")
+
+
+class ResultsTable(Dict[str, Dict[str, Optional[float]]]):
+    """Win-percentage matrix carrying its row/column ordering.
+
+    Formatters iterate `algo_names` instead of re-materializing
+    `list(results.keys())`, so every consumer shares one ordering.
+    """
+
+    def __init__(self, data: Dict[str, Dict[str, Optional[float]]],
+                 algo_names: Tuple[str, ...]):
+        super().__init__(data)
+        self.algo_names = algo_names
+
+
 class Tournament:
     """Manages tournament between algorithms"""
 
-    def __init__(self):
+    def __init__(self, seed_offset: int = 0):
+        # Mixed into every parallel game seed so tournaments started
+        # concurrently from identically seeded parents don't play the
+        # same games.
+        self.seed_offset = seed_offset
         self.algorithms = {
             "UR": self._make_entry("UR", URAlgorithm, "UR", 0),
             "PMCGS_500": self._make_entry("PMCGS_500", PMCGSAlgorithm, "PMCGS", 500),
@@ -482,59 +704,53 @@ class Tournament:
     def _make_entry(name: str, cls, kind: str, simulations: int) -> Dict[str, object]:
         return {"name": name, "cls": cls, "kind": kind, "sims": simulations}
 
-    @staticmethod
-    def _select_move(algo, spec: Dict[str, object], player: str) -> int:
-        """Dispatch select_move with the appropriate parameters."""
-        kind = spec["kind"]
-        sims = spec["sims"]
-
-        if kind == "UR":
-            return algo.select_move(player, "None", 0)
-        elif kind in {"PMCGS", "UCT"}:
-            return algo.select_move(player, "None", sims)
-        else:
-            raise ValueError(f"Unknown algorithm kind '{kind}'")
-
     def play_game(self, algo1_name: str, algo2_name: str) -> str:
         """Play a single game between two algorithms"""
         board = Board()
-        current_player = 'R'
+        current_player = R
         spec1 = self.algorithms[algo1_name]
         spec2 = self.algorithms[algo2_name]
-        algo1 = spec1["cls"](board)
-        algo2 = spec2["cls"](board)
+
+        # Dispatch is loop-invariant: bind each side's select_move and
+        # budget once instead of re-resolving them every move.
+        select1 = spec1["cls"](board).select_move
+        select2 = spec2["cls"](board).select_move
+        sims1 = spec1["sims"]
+        sims2 = spec2["sims"]
 
         while True:
-            if current_player == 'R':
-                move = self._select_move(algo1, spec1, current_player)
+            if current_player == R:
+                move = select1(current_player, "None", sims1)
             else:
-                move = self._select_move(algo2, spec2, current_player)
+                move = select2(current_player, "None", sims2)
 
             if move == -1 or not board.make_move(move, current_player):
                 # Invalid move, current player loses
-                return 'Y' if current_player == 'R' else 'R'
+                return 'Y' if current_player == R else 'R'
 
-            is_terminal, value = board.is_terminal()
-            if is_terminal:
-                if value == 1:
+            state = board.terminal_state(current_player)
+            if state:
+                if state == 1:
                     return 'Y'
-                elif value == -1:
+                elif state == -1:
                     return 'R'
                 else:
                     return 'Draw'
 
-            current_player = 'Y' if current_player == 'R' else 'R'
+            current_player = _opponent(current_player)
 
     def run_tournament(
         self,
         num_games: int = 100,
         parallel_workers: Optional[int] = None,
-    ) -> Dict[str, Dict[str, Optional[float]]]:
+    ) -> ResultsTable:
         """Run tournament between all algorithm pairs"""
-        algo_names = list(self.algorithms.keys())
-        results: Dict[str, Dict[str, Optional[float]]] = {
-            name: {opponent: None for opponent in algo_names} for name in algo_names
-        }
+        algo_names = tuple(self.algorithms)
+        results = ResultsTable(
+            {name: {opponent: None for opponent in algo_names}
+             for name in algo_names},
+            algo_names,
+        )
 
         use_parallel = parallel_workers is not None and parallel_workers > 1
 
@@ -585,64 +801,129 @@ class Tournament:
         if num_games == 0:
             return 0.0
 
-        seeds = [random.randrange(1_000_000_000) for _ in range(num_games)]
+        # Workers receive only (kind, sims) tuples; the class is resolved
+        # inside the worker so each task pickles a few dozen bytes.
+        row_spec = (self.algorithms[row]["kind"], self.algorithms[row]["sims"])
+        col_spec = (self.algorithms[col]["kind"], self.algorithms[col]["sims"])
+        seeds = [self.seed_offset + random.randrange(1_000_000_000)
+                 for _ in range(num_games)]
         row_is_red_flags = [(i % 2 == 0) for i in range(num_games)]
+        chunksize = max(1, num_games // ((parallel_workers or 1) * 4))
 
-        with ProcessPoolExecutor(max_workers=parallel_workers) as executor:
-            futures = []
-            for is_red, seed in zip(row_is_red_flags, seeds):
-                if is_red:
-                    red_spec = dict(self.algorithms[row])
-                    yellow_spec = dict(self.algorithms[col])
-                else:
-                    red_spec = dict(self.algorithms[col])
-                    yellow_spec = dict(self.algorithms[row])
-
-                futures.append(executor.submit(_play_game_worker, red_spec, yellow_spec, seed))
+        worker = partial(_pair_game_worker, row_spec, col_spec)
+        with _make_executor(parallel_workers) as executor:
+            winners = executor.map(worker, row_is_red_flags, seeds,
+                                   chunksize=chunksize)
 
             row_wins = 0
             draws = 0
 
-            for is_red, future in zip(row_is_red_flags, futures):
-                winner = future.result()
-                if is_red:
-                    if winner == 'R':
-                        row_wins += 1
-                    elif winner == 'Draw':
-                        draws += 1
-                else:
-                    if winner == 'Y':
-                        row_wins += 1
-                    elif winner == 'Draw':
-                        draws += 1
+            for is_red, winner in zip(row_is_red_flags, winners):
+                if winner == ('R' if is_red else 'Y'):
+                    row_wins += 1
+                elif winner == 'Draw':
+                    draws += 1
 
         return ((row_wins + 0.5 * draws) / num_games) * 100
 
 
-def _play_game_worker(red_spec: Dict[str, object], yellow_spec: Dict[str, object], seed: Optional[int] = None) -> str:
+def _root_parallel_worker(
+    bb0: int,
+    bb1: int,
+    heights: Tuple[int, ...],
+    kind: str,
+    player: int,
+    num_simulations: int,
+    seed: int,
+) -> List[Tuple[float, int]]:
+    """Build one independent tree and return per-column (wi, ni) sums."""
+    random.seed(seed)
+    seed_rollouts(seed)
+    board = Board()
+    board.bb = [bb0, bb1]
+    board.heights = array('b', heights)
+
+    cls = PMCGSAlgorithm if kind == "PMCGS" else UCTAlgorithm
+    root = cls(board)._search(player, "None", num_simulations)
+    return [(child.wi, child.ni) if child is not None else (0.0, 0)
+            for child in root.children]
+
+
+def _select_move_root_parallel(board: Board, kind: str, player: int,
+                               num_simulations: int, workers: int) -> int:
+    """Merge root-child statistics from `workers` independent searches.
+
+    Each worker receives only the bitboards, heights, and a distinct
+    seed, builds its own tree, and returns a length-7 stats list; the
+    merged move is the best mean value over the summed statistics.
+    """
+    per_worker = max(1, num_simulations // workers)
+    wi = [0.0] * Board.COLS
+    ni = [0] * Board.COLS
+
+    with _make_executor(workers) as executor:
+        futures = [
+            executor.submit(_root_parallel_worker, board.bb[0], board.bb[1],
+                            tuple(board.heights), kind, player, per_worker,
+                            random.getrandbits(32))
+            for _ in range(workers)
+        ]
+        for future in futures:
+            for col, (w, n) in enumerate(future.result()):
+                wi[col] += w
+                ni[col] += n
+
+    sign = 1.0 if player == Y else -1.0
+    best_move = -1
+    best_value = -float('inf')
+    for col in range(Board.COLS):
+        if ni[col] > 0:
+            value = sign * (wi[col] / ni[col])
+            if value > best_value:
+                best_value = value
+                best_move = col
+    return best_move
+
+
+# Resolves the light (kind, sims) worker specs back to classes
+_ALGO_CLASSES = {"UR": URAlgorithm, "PMCGS": PMCGSAlgorithm, "UCT": UCTAlgorithm}
+
+
+def _pair_game_worker(row_spec: Tuple[str, int], col_spec: Tuple[str, int],
+                      row_is_red: bool, seed: Optional[int] = None) -> str:
+    """Play one pairing game with the row algorithm on the given side."""
+    if row_is_red:
+        return _play_game_worker(row_spec, col_spec, seed)
+    return _play_game_worker(col_spec, row_spec, seed)
+
+
+def _play_game_worker(red_spec: Tuple[str, int], yellow_spec: Tuple[str, int], seed: Optional[int] = None) -> str:
     """Standalone game simulator for multiprocessing contexts."""
     if seed is not None:
         random.seed(seed)
+        seed_rollouts(seed)
 
     board = Board()
-    algo_red = red_spec["cls"](board)
-    algo_yellow = yellow_spec["cls"](board)
-    current_player = 'R'
+    red_kind, red_sims = red_spec
+    yellow_kind, yellow_sims = yellow_spec
+    algo_red = _ALGO_CLASSES[red_kind](board)
+    algo_yellow = _ALGO_CLASSES[yellow_kind](board)
+    current_player = R
 
     while True:
-        if current_player == 'R':
-            move = Tournament._select_move(algo_red, red_spec, current_player)
+        if current_player == R:
+            move = algo_red.select_move(current_player, "None", red_sims)
         else:
-            move = Tournament._select_move(algo_yellow, yellow_spec, current_player)
+            move = algo_yellow.select_move(current_player, "None", yellow_sims)
 
         if move == -1 or not board.make_move(move, current_player):
-            return 'Y' if current_player == 'R' else 'R'
+            return 'Y' if current_player == R else 'R'
 
-        is_terminal, value = board.is_terminal()
-        if is_terminal:
-            if value == 1:
+        state = board.terminal_state(current_player)
+        if state:
+            if state == 1:
                 return 'Y'
-            elif value == -1:
+            elif state == -1:
                 return 'R'
             else:
                 return 'Draw'
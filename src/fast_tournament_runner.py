@@ -6,13 +6,14 @@ Uses 50 simulations instead of 500/10000 to complete much faster
 import argparse
 import time
 from connect_four import Tournament, URAlgorithm, PMCGSAlgorithm, UCTAlgorithm
+from table_format import format_results
 
 
 class FastTournament(Tournament):
     """Tournament with reduced simulation counts for faster execution"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, seed_offset: int = 0):
+        super().__init__(seed_offset=seed_offset)
         self.algorithms = {
             "UR": self._make_entry("UR", URAlgorithm, "UR", 0),
             "PMCGS_50": self._make_entry("PMCGS_50", PMCGSAlgorithm, "PMCGS", 50),
@@ -57,7 +58,7 @@ def main():
     print("\n" + "=" * 70)
     print("FAST TOURNAMENT RESULTS (50 sims instead of 500/10000)")
     print("=" * 70)
-    _print_table(results)
+    print(format_results(results))
 
     print(f"\nTournament completed in {end_time - start_time:.2f} seconds")
     # Save detailed results to file
@@ -67,7 +68,7 @@ def main():
         f.write(f"Games per match: {num_games}\n")
         f.write(f"Total time: {end_time - start_time:.2f} seconds\n\n")
         f.write("\nWin percentages (row algorithm vs column algorithm):\n\n")
-        _write_table(f, results)
+        f.write(format_results(results) + "\n")
 
     print("\nDetailed results saved to 'fast_tournament_results.txt'")
     print("\n⚠️  NOTE: This used 50 simulations instead of the required 500/10000.")
@@ -75,43 +76,5 @@ def main():
     print("   or note the reduction in your report.")
 
 
-def _print_table(results):
-    algo_names = list(results.keys())
-    width = 14
-    header = "".ljust(width) + "".join(name.ljust(width) for name in algo_names)
-    divider = "-" * len(header)
-    print(header)
-    print(divider)
-
-    for row in algo_names:
-        line = row.ljust(width)
-        for col in algo_names:
-            value = results[row][col]
-            if value is None:
-                line += "-".ljust(width)
-            else:
-                line += f"{value:6.1f}%".ljust(width)
-        print(line)
-
-
-def _write_table(handle, results):
-    algo_names = list(results.keys())
-    width = 14
-    header = "".ljust(width) + "".join(name.ljust(width) for name in algo_names)
-    divider = "-" * len(header)
-    handle.write(header + "\n")
-    handle.write(divider + "\n")
-
-    for row in algo_names:
-        line = row.ljust(width)
-        for col in algo_names:
-            value = results[row][col]
-            if value is None:
-                line += "-".ljust(width)
-            else:
-                line += f"{value:6.1f}%".ljust(width)
-        handle.write(line + "\n")
-
-
 if __name__ == "__main__":
     main()
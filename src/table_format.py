@@ -0,0 +1,37 @@
+"""
+Shared results-table formatting for the tournament runners
+
+Both runners previously carried their own `_print_table`/`_write_table`
+copies; the formatting lives here once and is built as a single string
+so callers do one print or one file write.
+"""
+
+from typing import Dict, Optional
+
+_WIDTH = 14
+
+
+def format_results(results: Dict[str, Dict[str, Optional[float]]]) -> str:
+    """Render the win-percentage matrix as an aligned text table.
+
+    Rows and columns follow the table's `algo_names` ordering when the
+    results object carries one (ResultsTable does), else the dict
+    ordering; `None` cells (the self-play diagonal) render as `-`.
+    """
+    algo_names = getattr(results, 'algo_names', None) or list(results.keys())
+    lines = ["".ljust(_WIDTH)
+             + "".join(name.ljust(_WIDTH) for name in algo_names)]
+    lines.append("-" * len(lines[0]))
+
+    for row in algo_names:
+        row_map = results[row]
+        line = row.ljust(_WIDTH)
+        for col in algo_names:
+            value = row_map[col]
+            if value is None:
+                line += "-".ljust(_WIDTH)
+            else:
+                line += f"{value:6.1f}%".ljust(_WIDTH)
+        lines.append(line)
+
+    return "\n".join(lines)
@@ -6,6 +6,7 @@ Runs the tournament experiments required for Part II of the assignment
 import argparse
 import time
 from connect_four import Tournament
+from table_format import format_results
 
 
 def parse_args():
@@ -46,7 +47,7 @@ def main():
     print("\n" + "=" * 60)
     print("TOURNAMENT RESULTS")
     print("=" * 60)
-    _print_table(results)
+    print(format_results(results))
 
     print("\nTournament completed in {:.2f} seconds".format(end_time - start_time))
 
@@ -59,48 +60,10 @@ def main():
         f.write(f"Total time: {end_time - start_time:.2f} seconds\n\n")
 
         f.write("Win percentages (row algorithm vs column algorithm):\n\n")
-        _write_table(f, results)
+        f.write(format_results(results) + "\n")
 
     print("\nDetailed results saved to 'tournament_results.txt'")
 
 
-def _print_table(results):
-    algo_names = list(results.keys())
-    width = 14
-    header = "".ljust(width) + "".join(name.ljust(width) for name in algo_names)
-    divider = "-" * len(header)
-    print(header)
-    print(divider)
-
-    for row in algo_names:
-        line = row.ljust(width)
-        for col in algo_names:
-            value = results[row][col]
-            if value is None:
-                line += "-".ljust(width)
-            else:
-                line += f"{value:6.1f}%".ljust(width)
-        print(line)
-
-
-def _write_table(handle, results):
-    algo_names = list(results.keys())
-    width = 14
-    header = "".ljust(width) + "".join(name.ljust(width) for name in algo_names)
-    divider = "-" * len(header)
-    handle.write(header + "\n")
-    handle.write(divider + "\n")
-
-    for row in algo_names:
-        line = row.ljust(width)
-        for col in algo_names:
-            value = results[row][col]
-            if value is None:
-                line += "-".ljust(width)
-            else:
-                line += f"{value:6.1f}%".ljust(width)
-        handle.write(line + "\n")
-
-
 if __name__ == "__main__":
     main()
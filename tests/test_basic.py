@@ -5,7 +5,7 @@ Basic validation tests for Connect Four implementation
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-from connect_four import Board, URAlgorithm, PMCGSAlgorithm, UCTAlgorithm
+from connect_four import Board, URAlgorithm, PMCGSAlgorithm, UCTAlgorithm, R, Y
 
 
 def test_board():
@@ -19,14 +19,14 @@ def test_board():
     assert not board.is_terminal()[0]
 
     # Test making moves
-    assert board.make_move(0, 'R')
+    assert board.make_move(0, R)
     assert board.heights[0] == 1
-    assert board.grid[5][0] == 'R'
+    assert board.bb[R] & 1
 
     # Test undo
     assert board.undo_move(0)
     assert board.heights[0] == 0
-    assert board.grid[5][0] == 'O'
+    assert not (board.bb[R] & 1)
 
     print("✓ Board tests passed")
 
@@ -39,23 +39,23 @@ def test_win_conditions():
 
     # Test horizontal win
     for col in range(4):
-        board.make_move(col, 'R')
-    assert board.check_win('R')
+        board.make_move(col, R)
+    assert board.check_win(R)
 
     board = Board()
 
     # Test vertical win
     for row in range(4):
-        board.make_move(0, 'Y')
-    assert board.check_win('Y')
+        board.make_move(0, Y)
+    assert board.check_win(Y)
 
     board = Board()
 
     # Test diagonal win
     for i in range(4):
         for j in range(i):
-            board.make_move(j, 'R')  # Fill columns before diagonal
-        board.make_move(i, 'Y')
+            board.make_move(j, R)  # Fill columns before diagonal
+        board.make_move(i, Y)
     # This is a simplified test - in practice you'd need exact positioning
 
     print("✓ Win condition tests passed")
@@ -69,23 +69,39 @@ def test_algorithms():
 
     # Test UR
     ur = URAlgorithm(board)
-    move = ur.select_move('R', 'None', 0)
+    move = ur.select_move(R, 'None', 0)
     assert 0 <= move < 7
     assert board.is_valid_move(move)
 
     # Test PMCGS with small number of simulations
     pmcgs = PMCGSAlgorithm(board)
-    move = pmcgs.select_move('R', 'None', 10)
+    move = pmcgs.select_move(R, 'None', 10)
     assert 0 <= move < 7
 
     # Test UCT with small number of simulations
     uct = UCTAlgorithm(board)
-    move = uct.select_move('R', 'None', 10)
+    move = uct.select_move(R, 'None', 10)
     assert 0 <= move < 7
 
     print("✓ Algorithm tests passed")
 
 
+def test_rollout_cutoff():
+    """Regression: a search with rollout_cutoff set must actually run"""
+    print("Testing rollout cutoff...")
+
+    board = Board()
+
+    # Shallow enough that playouts hit the cutoff heuristic, deep
+    # enough that rollouts are actually reached
+    for algo_cls in (PMCGSAlgorithm, UCTAlgorithm):
+        algo = algo_cls(board, rollout_cutoff=12)
+        move = algo.select_move(R, 'None', 50)
+        assert 0 <= move < 7
+
+    print("✓ Rollout cutoff tests passed")
+
+
 def main():
     """Run all tests"""
     print("Running basic validation tests...\n")
@@ -94,6 +110,7 @@ def main():
         test_board()
         test_win_conditions()
         test_algorithms()
+        test_rollout_cutoff()
 
         print("\n" + "="*50)
         print("✓ All tests passed! Implementation looks good.")
@@ -0,0 +1,121 @@
+"""
+Tests for the opt-in search options and the bitboard playout kernels
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from connect_four import Board, PMCGSAlgorithm, UCTAlgorithm, R, Y
+from bitboard import (COLUMN_BASE, batch_rollout, copy_heights, rollout,
+                      rollout_center, rollout_cutoff, rollout_decisive)
+
+
+# A completely full board: every playout must return a draw immediately
+FULL_HEIGHTS = [base + 6 for base in COLUMN_BASE]
+
+# Column 3 holds three Yellow pieces and every other column is full, so
+# the only playable move completes Yellow's vertical four
+FORCED_WIN_BB_Y = 0b111 << COLUMN_BASE[3]
+FORCED_WIN_HEIGHTS = [base + 6 for base in COLUMN_BASE]
+FORCED_WIN_HEIGHTS[3] = COLUMN_BASE[3] + 3
+
+
+def test_kernels_draw_on_full_board():
+    """Every kernel (jitted or fallback) scores a full board as 0"""
+    print("Testing kernels on a full board...")
+
+    for kernel in (rollout, rollout_center, rollout_decisive):
+        assert kernel(0, 0, copy_heights(FULL_HEIGHTS), R) == 0
+    assert rollout_cutoff(0, 0, copy_heights(FULL_HEIGHTS), R, 5) == 0
+    assert batch_rollout(0, 0, FULL_HEIGHTS, R, 4) == 0
+
+    print("✓ Full-board kernel tests passed")
+
+
+def test_kernels_forced_win():
+    """Every kernel must find the single forced winning move"""
+    print("Testing kernels on a forced win...")
+
+    for kernel in (rollout, rollout_center, rollout_decisive):
+        assert kernel(0, FORCED_WIN_BB_Y,
+                      copy_heights(FORCED_WIN_HEIGHTS), Y) == 1
+    assert rollout_cutoff(0, FORCED_WIN_BB_Y,
+                          copy_heights(FORCED_WIN_HEIGHTS), Y, 5) == 1
+    # Batched playouts report the summed value across the batch
+    assert batch_rollout(0, FORCED_WIN_BB_Y, FORCED_WIN_HEIGHTS, Y, 4) == 4
+
+    print("✓ Forced-win kernel tests passed")
+
+
+def test_playout_policy_options():
+    """Each playout policy runs a small search and returns a legal move"""
+    print("Testing playout policies...")
+
+    board = Board()
+    for policy in ('uniform', 'center_biased', 'decisive'):
+        for algo_cls in (PMCGSAlgorithm, UCTAlgorithm):
+            algo = algo_cls(board, playout_policy=policy)
+            move = algo.select_move(R, 'None', 30)
+            assert 0 <= move < 7
+
+    print("✓ Playout policy tests passed")
+
+
+def test_rollout_batch_option():
+    """Batched rollouts run a small search and return a legal move"""
+    print("Testing rollout batching...")
+
+    board = Board()
+    for algo_cls in (PMCGSAlgorithm, UCTAlgorithm):
+        algo = algo_cls(board, rollout_batch=4)
+        move = algo.select_move(R, 'None', 30)
+        assert 0 <= move < 7
+
+    print("✓ Rollout batch tests passed")
+
+
+def test_tree_reuse_across_turns():
+    """A kept tree is resumed (or safely discarded) on the next turn"""
+    print("Testing tree reuse...")
+
+    board = Board()
+    algo = UCTAlgorithm(board)
+
+    first = algo.select_move(R, 'None', 40)
+    assert board.make_move(first, R)
+    board.make_move(board.get_legal_moves()[0], Y)
+
+    second = algo.select_move(R, 'None', 40)
+    assert board.is_valid_move(second)
+
+    print("✓ Tree reuse tests passed")
+
+
+def test_select_move_parallel():
+    """Root-parallel search merges worker trees into a legal move"""
+    print("Testing root-parallel search...")
+
+    board = Board()
+    for algo_cls in (PMCGSAlgorithm, UCTAlgorithm):
+        move = algo_cls(board).select_move_parallel(R, 40, 2)
+        assert 0 <= move < 7
+
+    print("✓ Root-parallel tests passed")
+
+
+def main():
+    """Run all search-option tests"""
+    print("Running search option tests...\n")
+
+    test_kernels_draw_on_full_board()
+    test_kernels_forced_win()
+    test_playout_policy_options()
+    test_rollout_batch_option()
+    test_tree_reuse_across_turns()
+    test_select_move_parallel()
+
+    print("\n✓ All search option tests passed!")
+
+
+if __name__ == "__main__":
+    main()
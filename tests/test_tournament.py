@@ -63,6 +63,15 @@ def test_parallel_tournament_consistency():
     assert parallel["UR"]["PMCGS_5"] is not None
 
 
+def test_seeded_worker_games_reproducible():
+    """Identically seeded worker games must replay identically."""
+    from connect_four import _play_game_worker
+
+    first = _play_game_worker(("PMCGS", 30), ("UCT", 30), seed=123)
+    second = _play_game_worker(("PMCGS", 30), ("UCT", 30), seed=123)
+    assert first == second
+
+
 def main():
     """Run tournament tests"""
     print("Testing tournament system...\n")